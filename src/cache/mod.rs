@@ -1,7 +1,7 @@
 #![warn(clippy::all, clippy::pedantic)]
 
 use crate::{
-    command::CommandPatterns,
+    command::COMMAND_PATTERNS,
     history::{CommandHistoryEntry, HistoryManager, HistoryTracker},
     shell::aliases::parse_shell_aliases,
     utils::{find_closest_match, get_path_commands},
@@ -11,7 +11,9 @@ use serde::{Deserialize, Serialize};
 use std::{
     collections::{HashMap, HashSet},
     fs::{self, File},
+    io::{BufWriter, Write},
     path::{Path, PathBuf},
+    sync::OnceLock,
     time::SystemTime,
 };
 
@@ -56,9 +58,10 @@ pub struct CommandCache {
     #[serde(default)]
     history_manager: HistoryManager,
 
-    /// Command patterns for well-known commands (not serialized)
+    /// Commands and alias names used for fuzzy matching, built on first use
+    /// and reset whenever either source changes (not serialized)
     #[serde(skip)]
-    command_patterns: CommandPatterns,
+    match_candidates: OnceLock<Vec<String>>,
 }
 
 impl Default for CommandCache {
@@ -71,7 +74,7 @@ impl Default for CommandCache {
             shell_aliases: HashMap::new(),
             alias_last_update: SystemTime::now(),
             history_manager: HistoryManager::default(),
-            command_patterns: CommandPatterns::new(),
+            match_candidates: OnceLock::new(),
         }
     }
 }
@@ -130,29 +133,25 @@ impl CommandCache {
     /// - There is an error updating the cache if needed
     pub fn load_from_path(path: &Path) -> Result<Self> {
         let cache = if path.exists() {
-            // Try to load the existing cache
-            let file = File::open(path)
+            // Try to load the existing cache, reading the file in one go rather than
+            // letting the deserializer pull it through an unbuffered reader
+            let contents = fs::read(path)
                 .with_context(|| format!("Failed to open cache file at {}", path.display()))?;
 
-            let mut cache: CommandCache = serde_json::from_reader(file)
+            let mut cache: CommandCache = serde_json::from_slice(&contents)
                 .with_context(|| format!("Failed to parse cache file at {}", path.display()))?;
 
             // Set the cache path
             cache.cache_path = Some(path.to_path_buf());
 
-            // Initialize command patterns
-            cache.command_patterns = CommandPatterns::new();
-
             // If the cache is too old, clear it
             if cache.should_clear_cache() {
                 cache.clear_cache();
             }
 
-            // If alias cache is too old, update it
-            if cache.should_update_aliases() {
-                cache.update_aliases();
-            }
-
+            // Stale aliases are refreshed by the matching paths through
+            // `refresh_aliases_if_stale`, so history and settings commands skip
+            // parsing shell configs
             cache
         } else {
             // Create a new cache
@@ -187,6 +186,13 @@ impl CommandCache {
         self.commands.is_empty() || self.should_clear_cache()
     }
 
+    /// Re-parse shell aliases if they are too old, without rescanning PATH
+    pub fn refresh_aliases_if_stale(&mut self) {
+        if self.should_update_aliases() {
+            self.set_aliases(parse_shell_aliases());
+        }
+    }
+
     /// Check if shell aliases should be updated due to age
     fn should_update_aliases(&self) -> bool {
         if let Ok(duration) = SystemTime::now().duration_since(self.alias_last_update) {
@@ -199,6 +205,7 @@ impl CommandCache {
     /// Clear the command cache (retains learned corrections)
     pub fn clear_cache(&mut self) {
         self.commands.clear();
+        self.invalidate_match_candidates();
         self.last_update = SystemTime::now();
     }
 
@@ -239,7 +246,13 @@ impl CommandCache {
                 format!("Failed to create cache file at {}", cache_path.display())
             })?;
 
-            serde_json::to_writer(file, self)
+            // Buffer the serializer output so the JSON lands in a few large writes
+            // instead of one write syscall per token
+            let mut writer = BufWriter::new(file);
+            serde_json::to_writer(&mut writer, self)
+                .with_context(|| format!("Failed to write cache to {}", cache_path.display()))?;
+            writer
+                .flush()
                 .with_context(|| format!("Failed to write cache to {}", cache_path.display()))?;
         }
 
@@ -296,6 +309,7 @@ impl CommandCache {
     /// Insert a command into the cache
     pub fn insert(&mut self, command: &str) {
         self.commands.insert(command.to_string());
+        self.invalidate_match_candidates();
     }
 
     /// Update the command cache with current PATH commands
@@ -311,31 +325,38 @@ impl CommandCache {
     /// - There is an error reading shell configuration files
     /// - There is an error saving the updated cache to disk
     pub fn update(&mut self) -> Result<()> {
-        self.update_path_commands();
+        let refresh_aliases = self.shell_aliases.is_empty() || self.should_update_aliases();
 
-        if self.shell_aliases.is_empty() || self.should_update_aliases() {
-            self.update_aliases();
+        // Scanning PATH and parsing shell configs are independent, so run them concurrently
+        let (path_commands, aliases) = rayon::join(get_path_commands, || {
+            refresh_aliases.then(parse_shell_aliases)
+        });
+
+        self.set_path_commands(path_commands);
+        if let Some(aliases) = aliases {
+            self.set_aliases(aliases);
         }
 
         self.last_update = SystemTime::now();
         self.save()
     }
 
-    /// Update commands from PATH
-    fn update_path_commands(&mut self) {
-        // Get commands from PATH
-        let path_commands = get_path_commands();
-
-        // Update the command set
+    /// Replace the command set with freshly scanned PATH commands
+    fn set_path_commands(&mut self, path_commands: HashSet<String>) {
         self.commands = path_commands;
+        self.invalidate_match_candidates();
     }
 
-    /// Update shell aliases
-    fn update_aliases(&mut self) {
-        if let Ok(aliases) = parse_shell_aliases() {
+    /// Replace shell aliases with freshly parsed ones, keeping the old set if parsing failed
+    ///
+    /// The refresh timestamp advances either way, so a broken shell config is
+    /// retried once per alias lifetime rather than on every call.
+    fn set_aliases(&mut self, aliases: Result<HashMap<String, String>>) {
+        if let Ok(aliases) = aliases {
             self.shell_aliases = aliases;
-            self.alias_last_update = SystemTime::now();
+            self.invalidate_match_candidates();
         }
+        self.alias_last_update = SystemTime::now();
     }
 
     /// Check if the cache contains a command
@@ -347,15 +368,22 @@ impl CommandCache {
     /// Get the closest matching command within a threshold
     #[must_use]
     pub fn get_closest_match(&self, command: &str, threshold: f64) -> Option<String> {
-        // Combine commands and alias names for matching
-        let mut all_commands: Vec<String> = self.commands.iter().cloned().collect();
-        all_commands.extend(self.shell_aliases.keys().cloned());
-
-        // Create a vector of references to use with find_closest_match
-        let command_refs: Vec<&String> = all_commands.iter().collect();
+        // Combine commands and alias names for matching, reusing the list across calls
+        let candidates = self.match_candidates.get_or_init(|| {
+            self.commands
+                .iter()
+                .chain(self.shell_aliases.keys())
+                .cloned()
+                .collect()
+        });
 
         // Find the closest match
-        find_closest_match(command, &command_refs, threshold).map(|s| (*s).to_string())
+        find_closest_match(command, candidates, threshold).cloned()
+    }
+
+    /// Drop the memoized match candidates after `commands` or `shell_aliases` change
+    fn invalidate_match_candidates(&mut self) {
+        self.match_candidates = OnceLock::new();
     }
 
     /// Get the target command for an alias
@@ -390,7 +418,7 @@ impl CommandCache {
         crate::command::fix_command_line(
             command_line,
             |cmd| self.find_similar(cmd),
-            &self.command_patterns,
+            &COMMAND_PATTERNS,
         )
     }
 
@@ -421,7 +449,7 @@ impl CommandCache {
     /// Update shell aliases (exposed for testing)
     #[cfg(test)]
     pub fn update_aliases_for_test(&mut self) {
-        self.update_aliases();
+        self.set_aliases(parse_shell_aliases());
     }
 
     /// Get the alias last update timestamp (helpful for testing)
@@ -436,6 +464,7 @@ impl CommandCache {
     pub fn add_test_alias(&mut self, alias: &str, command: &str) {
         self.shell_aliases
             .insert(alias.to_string(), command.to_string());
+        self.invalidate_match_candidates();
     }
 
     /// Check if a command exists in PATH or shell aliases
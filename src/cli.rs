@@ -26,6 +26,10 @@ pub struct Cli {
     #[arg(long, default_value_t = DEFAULT_CODE_MODEL.to_string())]
     pub code_model: String,
 
+    /// Enable debug logging
+    #[arg(short, long, global = true)]
+    pub verbose: bool,
+
     /// Command line to check (for command not found handler)
     #[arg(name = "command", last = true, allow_hyphen_values = true)]
     pub command_to_check: Vec<String>,
@@ -84,6 +88,8 @@ pub enum Commands {
         /// The correct command
         command: String,
     },
+    /// Answer `COMMAND\tARG` correction queries from stdin until it closes
+    Serve,
     /// Chat with AI about super snoofer
     Prompt {
         /// Question to ask
@@ -114,6 +120,10 @@ impl Cli {
                     codestral: false,
                     standard_model: DEFAULT_MODEL.to_string(),
                     code_model: DEFAULT_CODE_MODEL.to_string(),
+                    verbose: args[..sep_pos]
+                        .iter()
+                        .skip(1)
+                        .any(|arg| arg == "-v" || arg == "--verbose"),
                     command_to_check: args[sep_pos + 1..].to_vec(),
                 };
             }
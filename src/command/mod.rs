@@ -23,6 +23,10 @@ pub struct CommandPatterns {
 pub static COMMAND_REGEX: std::sync::LazyLock<Regex> =
     std::sync::LazyLock::new(|| Regex::new(r"^(?P<cmd>\S+)(?:\s+(?P<args>.+))?$").unwrap());
 
+/// Well-known command patterns, built once and shared by every cache instance
+pub static COMMAND_PATTERNS: std::sync::LazyLock<CommandPatterns> =
+    std::sync::LazyLock::new(CommandPatterns::new);
+
 impl CommandPatterns {
     /// Create a new `CommandPatterns` instance with predefined common commands
     #[must_use]
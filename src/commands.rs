@@ -1,8 +1,15 @@
 #![warn(clippy::all, clippy::pedantic)]
 
 use anyhow::Result;
-use std::{io::Write, process::Command};
-use crate::{CommandCache, HistoryTracker};
+use log::debug;
+use std::{
+    io::{BufRead, Write},
+    process::Command,
+};
+use crate::{cache::SIMILARITY_THRESHOLD, CommandCache, HistoryTracker};
+
+/// Separator written after every response in server mode
+pub const SERVER_RESPONSE_TERMINATOR: char = '\x1e';
 
 /// Learns a correction for a typo
 /// 
@@ -10,9 +17,9 @@ use crate::{CommandCache, HistoryTracker};
 /// Returns an error if saving the correction to the database fails
 pub fn learn_correction(typo: &str, command: &str) -> Result<()> {
     let mut cache = CommandCache::load()?;
+    // `learn_correction` persists the cache itself
     cache.learn_correction(typo, command)?;
     println!("Got it! 🐺 I'll remember that '{typo}' means '{command}'");
-    cache.save()?;
     Ok(())
 }
 
@@ -128,7 +135,6 @@ pub fn clear_history() -> Result<()> {
 pub fn enable_history() -> Result<()> {
     let mut cache = CommandCache::load()?;
     cache.enable_history()?;
-    cache.save()?;
     Ok(())
 }
 
@@ -139,7 +145,6 @@ pub fn enable_history() -> Result<()> {
 pub fn disable_history() -> Result<()> {
     let mut cache = CommandCache::load()?;
     cache.disable_history()?;
-    cache.save()?;
     Ok(())
 }
 
@@ -150,10 +155,12 @@ pub fn disable_history() -> Result<()> {
 pub fn check_command_line(command: &str) -> Result<()> {
     let mut cache = CommandCache::load()?;
     
-    // Always update if needed to get latest commands
+    // Always update if needed to get latest commands (`update` also saves and
+    // refreshes stale aliases)
     if cache.should_update() {
         cache.update()?;
-        cache.save()?;
+    } else {
+        cache.refresh_aliases_if_stale();
     }
     
     // Extract just the command part for display purposes
@@ -207,6 +214,61 @@ pub fn check_command_line(command: &str) -> Result<()> {
     Ok(())
 }
 
+/// Answers correction queries read line by line from `input`
+///
+/// Loads the user's cache and hands it to [`serve_with`].
+///
+/// # Errors
+/// Returns an error if the cache cannot be loaded or if reading requests or writing responses fails
+pub fn serve(input: impl BufRead, output: impl Write) -> Result<()> {
+    let mut cache = CommandCache::load()?;
+    serve_with(&mut cache, input, output)
+}
+
+/// Answers correction queries read line by line from `input` using `cache`
+///
+/// Each request is a `COMMAND\tARG` line, where `COMMAND` is one of `fix`,
+/// `similar` or `closest`. Every response is written to `output` followed by
+/// [`SERVER_RESPONSE_TERMINATOR`]; an empty response means no suggestion or an
+/// unknown request. The cache stays loaded between requests, so callers avoid
+/// one process spawn per query, and it is refreshed before a request whenever
+/// it has expired or its aliases are stale. A failed refresh is logged and the
+/// server keeps answering from the cache already in memory.
+///
+/// # Errors
+/// Returns an error if reading requests or writing responses fails
+pub fn serve_with(
+    cache: &mut CommandCache,
+    input: impl BufRead,
+    mut output: impl Write,
+) -> Result<()> {
+    for line in input.lines() {
+        let line = line?;
+        let (request, arg) = line.split_once('\t').unwrap_or((line.as_str(), ""));
+
+        // Keep a long-lived server from answering out of an expired cache
+        if cache.should_update() {
+            // A failed refresh must not end the session mid-request
+            if let Err(e) = cache.update() {
+                debug!("Failed to refresh command cache: {e:#}");
+            }
+        } else {
+            cache.refresh_aliases_if_stale();
+        }
+
+        let response = match request {
+            "fix" => cache.fix_command_line(arg),
+            "similar" => cache.find_similar(arg),
+            "closest" => cache.get_closest_match(arg, SIMILARITY_THRESHOLD),
+            _ => None,
+        };
+
+        write!(output, "{}{SERVER_RESPONSE_TERMINATOR}", response.unwrap_or_default())?;
+        output.flush()?;
+    }
+    Ok(())
+}
+
 /// Processes a full command line
 /// 
 /// # Errors
@@ -240,4 +302,29 @@ pub fn process_full_command(command: &str) -> Result<()> {
             }
         }
     }
-} 
\ No newline at end of file
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::io::Cursor;
+
+    #[test]
+    fn serve_with_answers_each_request_with_a_terminated_response() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let mut cache = CommandCache::new();
+        cache.set_cache_path(temp_dir.path().join("cache.json"));
+        for command in ["git", "ls", "cargo"] {
+            cache.insert(command);
+        }
+
+        let input = Cursor::new("fix\tgti\nclosest\tgti\nsimilar\tcarg\nbogus\tx\n");
+        let mut output = Vec::new();
+        serve_with(&mut cache, input, &mut output).unwrap();
+
+        assert_eq!(
+            String::from_utf8(output).unwrap(),
+            "git\x1egit\x1ecargo\x1e\x1e"
+        );
+    }
+}
@@ -21,6 +21,15 @@ mod tui;
 #[tokio::main]
 async fn main() -> Result<()> {
     let cli = Cli::parse_args();
+
+    // Configure logging once, scoped to this crate so dependency logs stay out of the TUI:
+    // info by default, debug with --verbose, and only warnings from other crates
+    let log_filter = if cli.verbose {
+        "warn,super_snoofer=debug"
+    } else {
+        "warn,super_snoofer=info"
+    };
+    env_logger::Builder::from_env(env_logger::Env::default().default_filter_or(log_filter)).init();
     
     // Create model configuration from CLI parameters
     let model_config = ModelConfig::new(cli.standard_model, cli.code_model);
@@ -130,6 +139,9 @@ async fn main() -> Result<()> {
             cmd::learn_correction(typo, command)?;
             println!("Correction learned successfully! 🐺");
         }
+        Some(Commands::Serve) => {
+            cmd::serve(std::io::stdin().lock(), std::io::stdout().lock())?;
+        }
         Some(Commands::Prompt { prompt, codestral, standard_model, code_model }) => {
             // Create a command-specific model config that overrides the global one
             let cmd_model_config = ModelConfig::new(standard_model.clone(), code_model.clone());
@@ -1,7 +1,13 @@
 #![warn(clippy::all, clippy::pedantic)]
 
 use log::debug;
-use std::{collections::HashSet, env, fs, path::Path};
+use rayon::prelude::*;
+use std::{
+    borrow::Cow,
+    collections::HashSet,
+    env, fs,
+    path::{Path, PathBuf},
+};
 use strsim::normalized_levenshtein;
 use walkdir::WalkDir;
 
@@ -98,12 +104,12 @@ pub fn levenshtein_distance(s1: &str, s2: &str) -> usize {
 #[must_use]
 pub fn calculate_similarity(a: &str, b: &str) -> f64 {
     // Handle case insensitivity by converting to lowercase
-    let a_lower = a.to_lowercase();
-    let b_lower = b.to_lowercase();
+    let a_lower = to_lowercase_cow(a);
+    let b_lower = to_lowercase_cow(b);
 
     // Use the lowercase strings for comparison
-    let a = a_lower.as_str();
-    let b = b_lower.as_str();
+    let a: &str = &a_lower;
+    let b: &str = &b_lower;
 
     // Handle special cases for very short strings
     if a.len() <= 3 && b.len() <= 3 {
@@ -117,17 +123,8 @@ pub fn calculate_similarity(a: &str, b: &str) -> f64 {
             return 0.9; // Very high similarity for this common typo
         }
 
-        // For other short strings, use a specialized similarity measure
-        let a_chars: Vec<char> = a.chars().collect();
-        let b_chars: Vec<char> = b.chars().collect();
-
-        // Count matching characters in any position
-        let mut matches = 0;
-        for c1 in &a_chars {
-            if b_chars.contains(c1) {
-                matches += 1;
-            }
-        }
+        // For other short strings, count matching characters in any position
+        let matches = a.chars().filter(|&c| b.contains(c)).count();
 
         // Calculate similarity based on matches and length
         let total = a.len().max(b.len());
@@ -145,6 +142,18 @@ pub fn calculate_similarity(a: &str, b: &str) -> f64 {
     }
 }
 
+/// Lowercase a string, borrowing it when it is already lowercase ASCII
+///
+/// Command names are almost always lowercase ASCII, so this skips the Unicode
+/// case mapping and the allocation on the hot matching path.
+fn to_lowercase_cow(s: &str) -> Cow<'_, str> {
+    if s.is_ascii() && !s.bytes().any(|b| b.is_ascii_uppercase()) {
+        Cow::Borrowed(s)
+    } else {
+        Cow::Owned(s.to_lowercase())
+    }
+}
+
 /// Checks if a file is executable on the current platform
 ///
 /// # Arguments
@@ -193,78 +202,20 @@ pub fn is_executable(path: &Path) -> bool {
 
 /// Get all commands from the PATH environment variable
 pub fn get_path_commands() -> HashSet<String> {
-    let mut commands = HashSet::new();
-
     // Get all directories in PATH
-    if let Some(path) = env::var_os("PATH") {
-        for dir in env::split_paths(&path) {
-            if dir.exists() {
-                for entry in WalkDir::new(dir)
-                    .max_depth(1)
-                    .into_iter()
-                    .filter_map(Result::ok)
-                {
-                    if (entry.file_type().is_file() || entry.file_type().is_symlink())
-                        && is_executable(entry.path())
-                    {
-                        if let Some(name) = entry.file_name().to_str() {
-                            commands.insert(name.to_string());
-
-                            // If this is a symlink, follow it and add target name
-                            #[cfg(unix)]
-                            if entry.file_type().is_symlink() {
-                                let mut current_path = entry.path().to_path_buf();
-                                let mut seen_paths = HashSet::new();
-
-                                // Follow symlink chain to handle multiple levels
-                                while current_path.is_symlink() {
-                                    // Add the current path to our seen paths set to detect cycles
-                                    if !seen_paths.insert(current_path.clone()) {
-                                        // Circular symlink detected, stop here
-                                        debug!("Circular symlink detected: {:?}", current_path);
-                                        break;
-                                    }
-
-                                    match fs::read_link(&current_path) {
-                                        Ok(target) => {
-                                            // Resolve the target path, making it absolute if needed
-                                            current_path = if target.is_absolute() {
-                                                target
-                                            } else {
-                                                // Relative paths are relative to the directory containing the symlink
-                                                if let Some(parent) = current_path.parent() {
-                                                    parent.join(&target)
-                                                } else {
-                                                    target
-                                                }
-                                            };
-
-                                            // Extract the command name from the resolved path
-                                            if let Some(target_name) = current_path.file_name() {
-                                                if let Some(name) = target_name.to_str() {
-                                                    commands.insert(name.to_string());
-                                                    debug!("Added symlink target: {}", name);
-                                                }
-                                            }
-                                        }
-                                        Err(e) => {
-                                            // Log errors but continue processing
-                                            debug!(
-                                                "Error following symlink {}: {}",
-                                                current_path.display(),
-                                                e
-                                            );
-                                            break;
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
+    let path_dirs: Vec<PathBuf> = env::var_os("PATH")
+        .map(|path| env::split_paths(&path).collect())
+        .unwrap_or_default();
+
+    // Scan the directories in parallel and merge the per-directory results
+    let mut commands = path_dirs
+        .par_iter()
+        .filter(|dir| dir.exists())
+        .map(|dir| scan_path_dir(dir))
+        .reduce(HashSet::new, |mut acc, found| {
+            acc.extend(found);
+            acc
+        });
 
     // Add Python scripts from Python directories
     for python_cmd in ["python", "python3"] {
@@ -297,6 +248,73 @@ pub fn get_path_commands() -> HashSet<String> {
     commands
 }
 
+/// Collect the executable commands (and symlink targets) found directly in `dir`
+fn scan_path_dir(dir: &Path) -> HashSet<String> {
+    let mut commands = HashSet::new();
+
+    for entry in WalkDir::new(dir)
+        .max_depth(1)
+        .into_iter()
+        .filter_map(Result::ok)
+    {
+        let file_type = entry.file_type();
+        if !(file_type.is_file() || file_type.is_symlink()) || !is_executable(entry.path()) {
+            continue;
+        }
+
+        let Some(name) = entry.file_name().to_str() else {
+            continue;
+        };
+        commands.insert(name.to_string());
+
+        // If this is a symlink, follow it and add target name
+        #[cfg(unix)]
+        if file_type.is_symlink() {
+            add_symlink_targets(entry.path(), &mut commands);
+        }
+    }
+
+    commands
+}
+
+/// Follow a symlink chain from `path`, adding the name of every target to `commands`
+#[cfg(unix)]
+fn add_symlink_targets(path: &Path, commands: &mut HashSet<String>) {
+    let mut current_path = path.to_path_buf();
+    let mut seen_paths = HashSet::new();
+
+    // Follow symlink chain to handle multiple levels
+    while current_path.is_symlink() {
+        // Add the current path to our seen paths set to detect cycles
+        if !seen_paths.insert(current_path.clone()) {
+            // Circular symlink detected, stop here
+            debug!("Circular symlink detected: {:?}", current_path);
+            break;
+        }
+
+        let target = match fs::read_link(&current_path) {
+            Ok(target) => target,
+            Err(e) => {
+                // Log errors but continue processing
+                debug!("Error following symlink {}: {}", current_path.display(), e);
+                break;
+            }
+        };
+
+        // Resolve the target path; relative targets are relative to the symlink's directory
+        current_path = match current_path.parent() {
+            Some(parent) if !target.is_absolute() => parent.join(&target),
+            _ => target,
+        };
+
+        // Extract the command name from the resolved path
+        if let Some(name) = current_path.file_name().and_then(|n| n.to_str()) {
+            commands.insert(name.to_string());
+            debug!("Added symlink target: {}", name);
+        }
+    }
+}
+
 /// Remove trailing flags from an argument
 /// e.g. "file.txt:10" -> ("file.txt", ":10")
 #[must_use]